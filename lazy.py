@@ -0,0 +1,22 @@
+## Helpers for building app components lazily
+import functools
+import threading
+
+# One re-entrant lock for every factory: task factories call agent factories,
+# which call tool and LLM factories, all while the outer build holds the lock
+_lock = threading.RLock()
+
+
+def singleton(factory):
+    """Build the factory's object on first call, exactly once even across threads"""
+    instance = []
+
+    @functools.wraps(factory)
+    def wrapper():
+        if not instance:
+            with _lock:
+                if not instance:
+                    instance.append(factory())
+        return instance[0]
+
+    return wrapper
@@ -1,26 +1,59 @@
 from fastapi import FastAPI, File, UploadFile, Form, HTTPException
+from contextlib import asynccontextmanager
+from dotenv import load_dotenv
 import os
 import uuid
 import asyncio
-from crewai import Crew, Process
-from agents import (
-    financial_analyst,
-    verifier,
-    investment_advisor,
-    risk_assessor
-)
-from tools import financial_document_tool
-from task import (  # Fixed import name
-    analyze_financial_document,
-    investment_analysis,
-    risk_assessment,
-    verification
-)
-
-app = FastAPI(title="Financial Document Analyzer")
+
+# Load environment variables once for the whole app; crewai, the LLM, tools,
+# agents and tasks are built lazily on first use (see warm_up below)
+load_dotenv()
+
+def warm_up():
+    """Pre-build the LLM, tools, agents and tasks so the first request doesn't pay for it."""
+    from tools import get_search_tool
+    from task import (
+        get_analyze_financial_document,
+        get_investment_analysis,
+        get_risk_assessment,
+        get_verification
+    )
+
+    get_search_tool()
+    get_verification()
+    get_analyze_financial_document()
+    get_investment_analysis()
+    get_risk_assessment()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Optionally warm up each worker after it starts (i.e. after any fork)."""
+    if os.getenv("WARMUP_ON_STARTUP", "").lower() in ("1", "true", "yes"):
+        try:
+            await asyncio.get_event_loop().run_in_executor(None, warm_up)
+        except Exception as e:
+            # Keep serving; the failing component is rebuilt on first request
+            print(f"Warning: Warm-up failed: {e}")
+    yield
+
+app = FastAPI(title="Financial Document Analyzer", lifespan=lifespan)
 
 def run_crew_sync(query: str, file_path: str):
     """Run all agents and tasks of the Crew on a financial document - SYNC VERSION."""
+    from crewai import Crew, Process
+    from agents import (
+        get_financial_analyst,
+        get_verifier,
+        get_investment_advisor,
+        get_risk_assessor
+    )
+    from tools import get_financial_document_tool
+    from task import (
+        get_analyze_financial_document,
+        get_investment_analysis,
+        get_risk_assessment,
+        get_verification
+    )
     
     # Verify file exists
     if not os.path.exists(file_path):
@@ -28,7 +61,7 @@ def run_crew_sync(query: str, file_path: str):
     
     # Test file reading first
     try:
-        test_content = financial_document_tool._run(file_path)
+        test_content = get_financial_document_tool()._run(file_path)
         if "Error" in test_content:
             raise Exception(f"File reading error: {test_content}")
     except Exception as e:
@@ -36,8 +69,13 @@ def run_crew_sync(query: str, file_path: str):
 
     # Create a Crew with all agents and tasks
     financial_crew = Crew(
-        agents=[verifier, financial_analyst, investment_advisor, risk_assessor],
-        tasks=[verification, analyze_financial_document, investment_analysis, risk_assessment],
+        agents=[get_verifier(), get_financial_analyst(), get_investment_advisor(), get_risk_assessor()],
+        tasks=[
+            get_verification(),
+            get_analyze_financial_document(),
+            get_investment_analysis(),
+            get_risk_assessment()
+        ],
         process=Process.sequential,
         verbose=True
     )
@@ -53,6 +91,22 @@ def run_crew_sync(query: str, file_path: str):
     
     return result
 
+def run_verify_sync(file_path: str):
+    """Run only the verifier agent and verification task on a document - SYNC VERSION."""
+    from crewai import Crew, Process
+    from agents import get_verifier
+    from task import get_verification
+
+    # Create crew with only verifier agent and verification task
+    verify_crew = Crew(
+        agents=[get_verifier()],
+        tasks=[get_verification()],
+        process=Process.sequential,
+        verbose=True
+    )
+
+    return verify_crew.kickoff({'file_path': file_path})
+
 async def run_crew(query: str, file_path: str):
     """Async wrapper for crew execution."""
     try:
@@ -169,19 +223,11 @@ async def verify_document_api(
                 raise HTTPException(status_code=400, detail="Empty file uploaded")
             f.write(content)
         
-        # Create crew with only verifier agent and verification task
-        verify_crew = Crew(
-            agents=[verifier],
-            tasks=[verification],
-            process=Process.sequential,
-            verbose=True
-        )
-        
         # Run synchronously in executor
         result = await asyncio.get_event_loop().run_in_executor(
             None, 
-            verify_crew.kickoff, 
-            {'file_path': file_path}
+            run_verify_sync, 
+            file_path
         )
         
         return {
@@ -0,0 +1,106 @@
+## Import-time profiling report for app startup
+# Usage: python profile_imports.py [module] [--top N] [--warm-up]
+#        python profile_imports.py --check
+import argparse
+import subprocess
+import sys
+import time
+
+# Modules `import main` must not load; they are only pulled in by the get_*()
+# factories, on first request or in warm_up()
+LAZY_MODULES = ["crewai", "crewai_tools", "fitz", "tools", "agents", "task"]
+
+
+def parse_importtime(stderr: str):
+    """Parse `python -X importtime` output into (self_us, cumulative_us, name) rows"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            # Header line: "self [us] | cumulative | imported package"
+            continue
+        rows.append((self_us, cumulative_us, parts[2].strip()))
+    return rows
+
+
+def run_python(code: str, *flags: str):
+    """Run a snippet in a fresh interpreter, exiting with its error output on failure"""
+    proc = subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True
+    )
+    if proc.returncode != 0:
+        print(proc.stderr[-2000:], file=sys.stderr)
+        sys.exit(proc.returncode)
+    return proc
+
+
+def check_lazy_imports():
+    """Fail if `import main` eagerly loads any of LAZY_MODULES"""
+    proc = run_python(
+        "import sys, main"
+        f"\nprint(' '.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    loaded = proc.stdout.split()
+    if loaded:
+        print(f"FAIL: import main eagerly loads: {', '.join(loaded)}", file=sys.stderr)
+        sys.exit(1)
+    print(f"OK: import main does not load {', '.join(LAZY_MODULES)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report import-time cost of the app modules.")
+    parser.add_argument("module", nargs="?", default="main", help="Module to import (default: main)")
+    parser.add_argument("--top", type=int, default=20, help="Number of slowest imports to show")
+    parser.add_argument("--warm-up", action="store_true", help="Also time main.warm_up() after import")
+    parser.add_argument("--check", action="store_true", help="Only check that import main stays lazy")
+    args = parser.parse_args()
+
+    if args.check:
+        check_lazy_imports()
+        return
+
+    if args.warm_up and args.module != "main":
+        parser.error("--warm-up is only supported for the 'main' module")
+
+    start = time.perf_counter()
+    proc = run_python(f"import {args.module}", "-X", "importtime")
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    # Time warm-up in its own process without -X importtime, so the modules it
+    # loads lazily don't show up in the import report and aren't instrumented
+    warm_up_output = ""
+    if args.warm_up:
+        warm_up_output = run_python(
+            "import time, main"
+            "\nstart = time.perf_counter()"
+            "\nmain.warm_up()"
+            "\nprint(f'warm_up: {(time.perf_counter() - start) * 1000:.1f} ms')"
+        ).stdout.strip()
+
+    rows = parse_importtime(proc.stderr)
+    top_level = next((r for r in reversed(rows) if r[2] == args.module), None)
+
+    print(f"Import report for '{args.module}'")
+    print(f"  modules imported : {len(rows)}")
+    if top_level:
+        print(f"  import '{args.module}' : {top_level[1] / 1000:.1f} ms (cumulative)")
+    print(f"  interpreter wall : {wall_ms:.1f} ms")
+    if warm_up_output:
+        print(f"  {warm_up_output}")
+
+    print(f"\nTop {args.top} imports by cumulative time:")
+    print(f"{'cumulative ms':>14} {'self ms':>10}  module")
+    for self_us, cumulative_us, name in sorted(rows, key=lambda r: r[1], reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>10.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
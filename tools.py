@@ -1,16 +1,18 @@
 import os
 import re
-import fitz  # PyMuPDF
-from dotenv import load_dotenv
+from lazy import singleton
 from crewai.tools import BaseTool
-from crewai_tools import SerperDevTool
 
-# Load environment variables
-load_dotenv()
-serper_api_key = os.getenv("SERPER_API_KEY")
 
-# Initialize search tool
-search_tool = SerperDevTool(api_key=serper_api_key)
+# -----------------------
+# Search Tool
+# -----------------------
+@singleton
+def get_search_tool():
+    """Build the Serper search tool on first use"""
+    # crewai_tools is heavy to import, so defer it until a tool is needed
+    from crewai_tools import SerperDevTool
+    return SerperDevTool(api_key=os.getenv("SERPER_API_KEY"))
 
 
 # -----------------------
@@ -26,6 +28,8 @@ class FinancialDocumentTool(BaseTool):
             if not os.path.exists(file_path):
                 return f"Error: File not found at {file_path}"
             
+            import fitz  # PyMuPDF
+
             text = ""
             doc = fitz.open(file_path)
             for page in doc:
@@ -40,7 +44,9 @@ class FinancialDocumentTool(BaseTool):
             return f"Error reading PDF: {str(e)}"
 
 
-financial_document_tool = FinancialDocumentTool()
+@singleton
+def get_financial_document_tool():
+    return FinancialDocumentTool()
 
 
 # ---------------------------
@@ -120,7 +126,9 @@ class InvestmentTool(BaseTool):
             return {"error": f"Investment analysis failed: {str(e)}"}
 
 
-investment_tool = InvestmentTool()
+@singleton
+def get_investment_tool():
+    return InvestmentTool()
 
 
 # ---------------------------
@@ -250,4 +258,6 @@ class RiskTool(BaseTool):
             return {"error": f"Risk assessment failed: {str(e)}"}
 
 
-risk_tool = RiskTool()
\ No newline at end of file
+@singleton
+def get_risk_tool():
+    return RiskTool()